@@ -14,6 +14,7 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+import collections
 import copy
 import random
 from random import SystemRandom
@@ -135,11 +136,12 @@ class Service(service.RPCService):
         tlds = self.storage.find_tlds(context)
         if tlds:
             LOG.debug("Checking if %s has a valid TLD", zone_name)
+            tld_names = {tld.name for tld in tlds}
             allowed = False
             for i in range(-len(zone_labels), 0):
                 last_i_labels = zone_labels[i:]
                 LOG.debug("Checking %s against the TLD list", last_i_labels)
-                if ".".join(last_i_labels) in tlds:
+                if ".".join(last_i_labels) in tld_names:
                     allowed = True
                     break
             if not allowed:
@@ -228,18 +230,25 @@ class Service(service.RPCService):
 
         child_zones = self.storage.find_zones(
             context, {"parent_zone_id": zone.id})
-        for child_zone in child_zones:
-            try:
-                self._is_valid_recordset_name(
-                    context, child_zone, recordset_name)
-            except Exception:
+        if not child_zones:
+            return
+
+        child_zones = {
+            child_zone['name']: child_zone for child_zone in child_zones
+        }
+
+        # Walk the recordset name one label at a time, from the longest
+        # suffix down, instead of matching it against every child zone.
+        labels = recordset_name.split('.')
+        for i in range(len(labels) - 1):
+            child_zone = child_zones.get('.'.join(labels[i:]))
+            if child_zone is None:
                 continue
-            else:
-                msg = (
-                    'RecordSet belongs in a child zone: {}'
-                    .format(child_zone['name'])
-                )
-                raise exceptions.InvalidRecordSetLocation(msg)
+            msg = (
+                'RecordSet belongs in a child zone: {}'
+                .format(child_zone['name'])
+            )
+            raise exceptions.InvalidRecordSetLocation(msg)
 
     def _is_valid_recordset_records(self, recordset):
         """
@@ -303,22 +312,19 @@ class Service(service.RPCService):
         # Break the name up into it's component labels
         labels = zone_name.split(".")
 
-        criterion = {"pool_id": pool_id}
+        # Starting with label #2, look up every candidate parent name in a
+        # single query rather than issuing one query per label
+        names = ['.'.join(labels[i:]) for i in range(1, len(labels))]
+        if not names:
+            return False
 
-        i = 1
+        criterion = {"name": names, "pool_id": pool_id}
+        zones = self.storage.find_zones(context, criterion)
+        if not zones:
+            return False
 
-        # Starting with label #2, search for matching zone's in the database
-        while (i < len(labels)):
-            name = '.'.join(labels[i:])
-            criterion["name"] = name
-            try:
-                zone = self.storage.find_zone(context, criterion)
-            except exceptions.ZoneNotFound:
-                i += 1
-            else:
-                return zone
-
-        return False
+        # The closest parent is the one with the longest name
+        return max(zones, key=lambda zone: len(zone.name))
 
     def _is_superzone(self, context, zone_name, pool_id):
         """
@@ -1636,9 +1642,16 @@ class Service(service.RPCService):
     @rpc.expected_exceptions()
     def delete_managed_records(self, context, zone_id, criterion):
         records = self.storage.find_records(context, criterion)
+
+        # Group the records by recordset, so that each recordset is only
+        # updated (or deleted) once regardless of how many records it holds.
+        records_by_recordset = collections.defaultdict(set)
         for record in records:
-            self._delete_or_update_managed_recordset(
-                context, zone_id, record['recordset_id'], record['id']
+            records_by_recordset[record['recordset_id']].add(record['id'])
+
+        for recordset_id, record_ids in records_by_recordset.items():
+            self._delete_or_update_managed_records(
+                context, zone_id, recordset_id, record_ids
             )
 
     @rpc.expected_exceptions()
@@ -1898,11 +1911,19 @@ class Service(service.RPCService):
         """
         project_id = project_id or context.project_id
 
+        if not fips:
+            return {}, []
+
         elevated_context = context.elevated(all_tenants=True,
                                             edit_managed_records=True)
+        # Only fetch the records of the FIPs we were given, rather than
+        # the records of every FIP across all projects.
         criterion = {
             'managed': True,
             'managed_resource_type': 'ptr:floatingip',
+            'managed_extra': [
+                fip_values['address'] for fip_values in fips.values()
+            ],
         }
 
         records = self.find_records(elevated_context, criterion)
@@ -1943,14 +1964,23 @@ class Service(service.RPCService):
 
         elevated_context = context.elevated(all_tenants=True,
                                             edit_managed_records=True)
+
+        # Update each recordset only once, however many of its records
+        # are being deleted.
+        records_by_recordset = collections.defaultdict(set)
         for record in records:
             LOG.debug('Deleting record %s for FIP %s',
                       record['id'], record['managed_resource_id'])
-            self._delete_or_update_managed_recordset(
-                elevated_context, record.zone_id, record.recordset_id,
+            records_by_recordset[record.zone_id, record.recordset_id].add(
                 record['id']
             )
 
+        for key, record_ids in records_by_recordset.items():
+            zone_id, recordset_id = key
+            self._delete_or_update_managed_records(
+                elevated_context, zone_id, recordset_id, record_ids
+            )
+
     def _list_floatingips(self, context, region=None):
         data = self.network_api.list_floatingips(context, region=region)
         return self._list_to_dict(data, keys=['region', 'id'])
@@ -2203,30 +2233,36 @@ class Service(service.RPCService):
             fips.append(fip_ptr)
         return fips
 
-    @transaction
     def _delete_or_update_managed_recordset(self, context, zone_id,
                                             recordset_id,
                                             record_to_delete_id):
+        self._delete_or_update_managed_records(
+            context, zone_id, recordset_id, {record_to_delete_id}
+        )
+
+    @transaction
+    def _delete_or_update_managed_records(self, context, zone_id,
+                                          recordset_id, record_ids_to_delete):
         criterion = {'id': recordset_id}
         if zone_id is not None:
             criterion['zone_id'] = zone_id
 
         try:
             recordset = self.storage.find_recordset(context, criterion)
-            record_ids = [record['id'] for record in recordset.records]
 
-            if record_to_delete_id not in record_ids:
+            records_to_delete = [
+                record for record in recordset.records
+                if record['id'] in record_ids_to_delete
+            ]
+            if not records_to_delete:
                 LOG.debug(
-                    'Managed record %s not found in recordset %s',
-                    record_to_delete_id, recordset_id
+                    'Managed records %s not found in recordset %s',
+                    ', '.join(record_ids_to_delete), recordset_id
                 )
                 return
 
-            for record in list(recordset.records):
-                if record['id'] != record_to_delete_id:
-                    continue
+            for record in records_to_delete:
                 recordset.records.remove(record)
-                break
 
             if not recordset.records:
                 self.delete_recordset(
@@ -2239,10 +2275,34 @@ class Service(service.RPCService):
         except exceptions.RecordSetNotFound:
             pass
 
+    @staticmethod
+    def _has_managed_records(recordset, records_values):
+        """
+        Check if the recordset holds exactly the records described by
+        records_values.
+        """
+        if len(recordset.records) != len(records_values):
+            return False
+
+        keys = set().union(*records_values)
+        existing = collections.Counter()
+        for record in recordset.records:
+            if record.action == 'DELETE':
+                return False
+            existing[frozenset((key, record.get(key)) for key in keys)] += 1
+
+        requested = collections.Counter(
+            frozenset(record_values.items())
+            for record_values in records_values
+        )
+        return existing == requested
+
     @transaction
     def _create_or_update_managed_recordset(self, context, zone_id,
                                             records_values, recordset_values):
-        name = recordset_values['name'].encode('idna').decode('utf-8')
+        name = recordset_values['name']
+        if not name.isascii():
+            name = name.encode('idna').decode('utf-8')
         records = []
         for record_values in records_values:
             records.append(objects.Record(**record_values))
@@ -2254,6 +2314,11 @@ class Service(service.RPCService):
                 'name': name,
                 'type': recordset_values['type'],
             })
+            if (recordset.ttl == recordset_values.get('ttl') and
+                    self._has_managed_records(recordset, records_values)):
+                # Nothing to change, e.g. a notification that was delivered
+                # twice. Skip the update to avoid bumping the zone serial.
+                return recordset
             recordset.ttl = recordset_values.get('ttl')
             recordset.records = objects.RecordList(objects=records)
             recordset.validate()
@@ -2449,11 +2514,13 @@ class Service(service.RPCService):
 
         policy.check('delete_pool', context)
 
-        # Make sure that there are no existing zones in the pool
+        # Make sure that there are no existing zones in the pool, a single
+        # zone is enough to tell.
         elevated_context = context.elevated(all_tenants=True)
         zones = self.find_zones(
             context=elevated_context,
-            criterion={'pool_id': pool_id, 'action': '!DELETE'})
+            criterion={'pool_id': pool_id, 'action': '!DELETE'},
+            limit=1)
 
         # If there are existing zones, do not delete the pool
         LOG.debug("Zones is None? %r", zones)
@@ -12,6 +12,7 @@
 
 import functools
 import inspect
+import logging
 import threading
 
 from oslo_messaging.rpc import dispatcher as rpc_dispatcher
@@ -58,13 +59,16 @@ def expected_exceptions():
 
 def log_rpc_call(func, rpcapi, logger):
     def wrapped(*args, **kwargs):
-        logger.debug(
-            'Calling designate.%(rpcapi)s.%(function)s() over RPC',
-            {
-                'function': func.__name__,
-                'rpcapi': rpcapi
-            }
-        )
+        # This wraps every RPC call, so skip building the log arguments
+        # unless they are actually going to be logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                'Calling designate.%(rpcapi)s.%(function)s() over RPC',
+                {
+                    'function': func.__name__,
+                    'rpcapi': rpcapi
+                }
+            )
         return func(*args, **kwargs)
     return wrapped
 
@@ -47,6 +47,18 @@ SINK_OPTS = [
                     'notification listener. '
                     'Note that listener pooling is not supported '
                     'by all oslo.messaging drivers.'),
+    cfg.IntOpt('zone_cache_ttl', default=60,
+               help='Number of seconds notification handlers cache the '
+                    'zones they look up. Set to 0 to disable caching.'),
+    cfg.IntOpt('zone_cache_size', default=1024, min=1,
+               help='Maximum number of zones kept in the zone cache shared '
+                    'by all notification handlers in a sink process.'),
+    cfg.IntOpt('zone_negative_cache_ttl', default=30,
+               help='Number of seconds notification handlers remember that '
+                    'a zone does not exist. Set to 0 to disable.'),
+    cfg.IntOpt('zone_lookup_timeout', default=30, min=1,
+               help='Number of seconds a notification handler waits for '
+                    'another handler to finish looking up the same zone.'),
 ]
 
 SINK_FAKE_OPTS = [
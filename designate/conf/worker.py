@@ -51,7 +51,10 @@ WORKER_OPTS = [
                     'serial.',
                default=3),
     cfg.IntOpt('serial_retry_delay',
-               help='The time to wait before retrying a zone serial request.',
+               help='Base delay in seconds between zone serial requests. '
+                    'Retries back off exponentially with some random '
+                    'jitter, starting at half of this value, and each wait '
+                    'is capped at twice this value.',
                default=1),
     cfg.IntOpt('serial_timeout',
                help='Timeout in seconds before giving up on fetching a zones '
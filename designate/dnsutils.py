@@ -227,10 +227,10 @@ def get_serial(zone_name, host, port=53):
     resp = soa_query(zone_name, host, port=port)
     if not resp.answer:
         return 0
-    rdataset = resp.answer[0].to_rdataset()
-    if not rdataset:
+    rrset = resp.answer[0]
+    if not rrset:
         return 0
-    return rdataset[0].serial
+    return rrset[0].serial
 
 
 def get_ip_address(ip_address_or_hostname):
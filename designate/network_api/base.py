@@ -13,7 +13,8 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
-import eventlet.patcher
+import ipaddress
+
 from oslo_log import log as logging
 
 import designate.conf
@@ -23,9 +24,6 @@ from designate.plugin import DriverPlugin
 
 CONF = designate.conf.CONF
 LOG = logging.getLogger(__name__)
-# NOTE(kiall): This is a workaround for bug #1424621, a broken reimplementation
-#              of eventlet's 0.17.0 monkey patching of dnspython.
-reversename = eventlet.patcher.original('dns.reversename')
 
 
 class NetworkAPI(DriverPlugin):
@@ -133,14 +131,26 @@ class NetworkAPI(DriverPlugin):
     def address_zone(address):
         """
         Get the zone a address belongs to.
+
+        This is the /24 in-addr.arpa. zone for IPv4 addresses and the /64
+        ip6.arpa. zone for IPv6 addresses.
         """
-        parts = reversed(address.split('.')[:-1])
-        return '%s.in-addr.arpa.' % ".".join(parts)
+        ip = NetworkAPI._ip_address(address)
+        # Strip the host labels (one octet or 16 nibbles) from the pointer.
+        host_labels = 1 if ip.version == 4 else 16
+        return '%s.' % ip.reverse_pointer.split('.', host_labels)[-1]
 
     @staticmethod
     def address_name(address):
         """
         Get the name for the address
         """
-        name = reversename.from_address(address).to_text()
-        return name
+        return '%s.' % NetworkAPI._ip_address(address).reverse_pointer
+
+    @staticmethod
+    def _ip_address(address):
+        ip = ipaddress.ip_address(address)
+        # Like dnspython, map IPv4-mapped IPv6 addresses into in-addr.arpa.
+        if ip.version == 6 and ip.ipv4_mapped:
+            return ip.ipv4_mapped
+        return ip
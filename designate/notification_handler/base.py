@@ -15,6 +15,10 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 import abc
+import collections
+from concurrent import futures
+import threading
+import time
 
 from oslo_log import log as logging
 
@@ -23,6 +27,7 @@ import re
 from designate.central import rpcapi as central_rpcapi
 import designate.conf
 from designate.context import DesignateContext
+from designate import exceptions
 from designate.plugin import ExtensionPlugin
 
 
@@ -35,9 +40,15 @@ class NotificationHandler(ExtensionPlugin):
     __plugin_ns__ = 'designate.notification.handler'
     __plugin_type__ = 'handler'
 
+    # The zone cache is shared by all handlers, so a zone looked up by one
+    # handler is not fetched from central again by another.
+    _zone_cache = collections.OrderedDict()
+    _zone_cache_lock = threading.Lock()
+    _zone_lookups = {}
+
     def __init__(self, *args, **kw):
         super().__init__(*args, **kw)
-        self.central_api = central_rpcapi.CentralAPI()
+        self.central_api = central_rpcapi.CentralAPI.get_instance()
 
     @abc.abstractmethod
     def get_exchange_topics(self):
@@ -49,7 +60,8 @@ class NotificationHandler(ExtensionPlugin):
     @abc.abstractmethod
     def get_event_types(self):
         """
-        Returns a list of event types this handler is capable of  processing
+        Returns a sequence of event types this handler is capable of
+        processing
         """
 
     @abc.abstractmethod
@@ -59,15 +71,109 @@ class NotificationHandler(ExtensionPlugin):
     def get_zone(self, zone_id):
         """
         Return the zone for this context
+
+        Zones are cached for [service:sink] zone_cache_ttl seconds, as the
+        same zone is looked up for every notification a handler processes.
+        At most [service:sink] zone_cache_size zones are kept, evicting the
+        least recently used first. Zones that do not exist are remembered
+        for [service:sink] zone_negative_cache_ttl seconds. Threads waiting
+        on another thread's lookup of the same zone give up after
+        [service:sink] zone_lookup_timeout seconds.
         """
+        cache_ttl = CONF['service:sink'].zone_cache_ttl
+        if cache_ttl <= 0:
+            return self._fetch_zone(zone_id)
+
+        with self._zone_cache_lock:
+            cached = self._zone_cache.get(zone_id)
+            if cached and cached[0] > time.monotonic():
+                self._zone_cache.move_to_end(zone_id)
+                if cached[1] is None:
+                    raise exceptions.ZoneNotFound()
+                return cached[1]
+            self._zone_cache.pop(zone_id, None)
+
+            pending = self._zone_lookups.get(zone_id)
+            if pending is None:
+                lookup = futures.Future()
+                self._zone_lookups[zone_id] = lookup
+
+        if pending is not None:
+            # Another thread is already fetching this zone, wait for it
+            # rather than sending central the same request again.
+            return pending.result(
+                timeout=CONF['service:sink'].zone_lookup_timeout
+            )
+
+        # Central is called without holding the lock, so a slow lookup only
+        # holds up the threads waiting for this same zone. The lookup is
+        # always finished, so waiters are never left behind on an error.
+        zone = None
+        error = None
+        try:
+            zone = self._fetch_zone(zone_id)
+        except exceptions.ZoneNotFound as e:
+            error = e
+            negative_ttl = CONF['service:sink'].zone_negative_cache_ttl
+            if negative_ttl > 0:
+                self._cache_zone(zone_id, None, negative_ttl)
+            raise
+        except BaseException as e:
+            error = e
+            raise
+        else:
+            self._cache_zone(zone_id, zone, cache_ttl)
+        finally:
+            self._finish_lookup(zone_id, lookup, zone=zone, exception=error)
+
+        return zone
+
+    def _cache_zone(self, zone_id, zone, ttl):
+        cache_size = CONF['service:sink'].zone_cache_size
+        with self._zone_cache_lock:
+            self._zone_cache[zone_id] = (time.monotonic() + ttl, zone)
+            self._zone_cache.move_to_end(zone_id)
+            while len(self._zone_cache) > cache_size:
+                self._zone_cache.popitem(last=False)
+
+    def _finish_lookup(self, zone_id, lookup, zone=None, exception=None):
+        with self._zone_cache_lock:
+            self._zone_lookups.pop(zone_id, None)
+        if exception is not None:
+            lookup.set_exception(exception)
+        else:
+            lookup.set_result(zone)
+
+    def _fetch_zone(self, zone_id):
         context = DesignateContext.get_admin_context(all_tenants=True)
         return self.central_api.get_zone(context, zone_id)
 
+    def invalidate_zone(self, zone_id):
+        """
+        Remove a zone from the zone cache
+        """
+        with self._zone_cache_lock:
+            self._zone_cache.pop(zone_id, None)
+
+    @classmethod
+    def clear_zone_cache(cls):
+        """
+        Remove all zones from the zone cache
+        """
+        with cls._zone_cache_lock:
+            cls._zone_cache.clear()
+            cls._zone_lookups.clear()
+
 
 class BaseAddressHandler(NotificationHandler):
     default_formatv4 = ('%(hostname)s.%(zone)s',)
     default_formatv6 = ('%(hostname)s.%(zone)s',)
 
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._formatv4 = self._get_formatv4()
+        self._formatv6 = self._get_formatv6()
+
     def _get_ip_data(self, addr_dict):
         ip = addr_dict['address']
         version = addr_dict['version']
@@ -78,14 +184,15 @@ class BaseAddressHandler(NotificationHandler):
 
         if version == 4:
             data['ip_address'] = ip.replace('.', '-')
-            ip_data = ip.split(".")
-            for i in [0, 1, 2, 3]:
-                data["octet%s" % i] = ip_data[i]
-        if version == 6:
+            ip_data = ip.split('.')
+        elif version == 6:
             data['ip_address'] = ip.replace(':', '-')
             ip_data = re.split('::|:', ip)
-            for i in range(len(ip_data)):
-                data["octet%s" % i] = ip_data[i]
+        else:
+            return data
+
+        for i, octet in enumerate(ip_data):
+            data['octet%s' % i] = octet
         return data
 
     def _get_formatv4(self):
@@ -112,6 +219,11 @@ class BaseAddressHandler(NotificationHandler):
         :param resource_type: The managed resource type
         :param resource_id: The managed resource ID
         """
+        if not addresses:
+            LOG.debug('No addresses to create records for in zone %s',
+                      zone_id)
+            return
+
         LOG.debug('Using Zone ID: %s', zone_id)
         zone = self.get_zone(zone_id)
         LOG.debug('Zone: %r', zone)
@@ -120,38 +232,60 @@ class BaseAddressHandler(NotificationHandler):
         LOG.debug('Event data: %s', data)
         data['zone'] = zone['name']
 
-        context = DesignateContext().elevated()
-        context.all_tenants = True
-        context.edit_managed_records = True
+        context = DesignateContext.get_admin_context(
+            all_tenants=True, edit_managed_records=True
+        )
 
+        # Addresses that format to the same name belong to one recordset,
+        # so collect all of their records and create each recordset with a
+        # single call to central.
+        recordsets = {}
         for addr in addresses:
-            event_data = data.copy()
-            event_data.update(self._get_ip_data(addr))
+            # Layer the address data over the event data instead of copying
+            # the whole notification payload for every address.
+            event_data = collections.ChainMap(self._get_ip_data(addr), data)
 
             if addr['version'] == 4:
-                format = self._get_formatv4()
+                format = self._formatv4
+                record_type = 'A'
             else:
-                format = self._get_formatv6()
+                format = self._formatv6
+                record_type = 'AAAA'
 
             for fmt in format:
-                recordset_values = {
-                    'zone_id': zone['id'],
-                    'name': fmt % event_data,
-                    'type': 'A' if addr['version'] == 4 else 'AAAA'}
-
-                record_values = {
+                name = fmt % event_data
+                records_values = recordsets.setdefault((name, record_type), {
+                    'recordset_values': {
+                        'zone_id': zone['id'],
+                        'name': name,
+                        'type': record_type,
+                    },
+                    'records_values': [],
+                })['records_values']
+                if any(record_values['data'] == addr['address']
+                       for record_values in records_values):
+                    continue
+
+                records_values.append({
                     'data': addr['address'],
                     'managed': True,
                     'managed_plugin_name': self.get_plugin_name(),
                     'managed_plugin_type': self.get_plugin_type(),
                     'managed_resource_type': resource_type,
                     'managed_resource_id': resource_id
-                }
+                })
+
+        for recordset in recordsets.values():
+            try:
                 self.central_api.create_managed_records(
                     context, zone['id'],
-                    records_values=[record_values],
-                    recordset_values=recordset_values,
+                    records_values=recordset['records_values'],
+                    recordset_values=recordset['recordset_values'],
                 )
+            except exceptions.ZoneNotFound:
+                # The cached zone is gone, look it up again next time.
+                self.invalidate_zone(zone_id)
+                raise
 
     def _delete(self, zone_id=None, resource_id=None, resource_type='instance',
                 criterion=None):
@@ -165,9 +299,9 @@ class BaseAddressHandler(NotificationHandler):
         """
         criterion = criterion or {}
 
-        context = DesignateContext().elevated()
-        context.all_tenants = True
-        context.edit_managed_records = True
+        context = DesignateContext.get_admin_context(
+            all_tenants=True, edit_managed_records=True
+        )
 
         criterion.update({
             'managed': True,
@@ -27,24 +27,28 @@ class NeutronFloatingHandler(base.BaseAddressHandler):
     """Handler for Neutron's notifications"""
     __plugin_name__ = 'neutron_floatingip'
 
-    def get_exchange_topics(self):
-        exchange = CONF[self.name].control_exchange
+    _EVENT_TYPES = (
+        'floatingip.update.end',
+        'floatingip.delete.start',
+    )
 
-        topics = [topic for topic in CONF[self.name].notification_topics]
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._exchange = CONF[self.name].control_exchange
+        self._topics = list(CONF[self.name].notification_topics)
+        self._zone_id = CONF[self.name].zone_id
 
-        return (exchange, topics)
+    def get_exchange_topics(self):
+        return (self._exchange, self._topics)
 
     def get_event_types(self):
-        return [
-            'floatingip.update.end',
-            'floatingip.delete.start'
-        ]
+        return self._EVENT_TYPES
 
     def process_notification(self, context, event_type, payload):
         LOG.debug('%s received notification - %s',
                   self.get_canonical_name(), event_type)
 
-        zone_id = CONF[self.name].zone_id
+        zone_id = self._zone_id
 
         if not zone_id:
             LOG.error('NeutronFloatingHandler: zone_id is None, '
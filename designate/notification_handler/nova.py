@@ -27,18 +27,22 @@ class NovaFixedHandler(BaseAddressHandler):
     """Handler for Nova's notifications"""
     __plugin_name__ = 'nova_fixed'
 
-    def get_exchange_topics(self):
-        exchange = CONF[self.name].control_exchange
+    _EVENT_TYPES = (
+        'compute.instance.create.end',
+        'compute.instance.delete.start',
+    )
 
-        topics = [topic for topic in CONF[self.name].notification_topics]
+    def __init__(self, *args, **kw):
+        super().__init__(*args, **kw)
+        self._exchange = CONF[self.name].control_exchange
+        self._topics = list(CONF[self.name].notification_topics)
+        self._zone_id = CONF[self.name].zone_id
 
-        return (exchange, topics)
+    def get_exchange_topics(self):
+        return (self._exchange, self._topics)
 
     def get_event_types(self):
-        return [
-            'compute.instance.create.end',
-            'compute.instance.delete.start',
-        ]
+        return self._EVENT_TYPES
 
     def _get_ip_data(self, addr_dict):
         data = super()._get_ip_data(addr_dict)
@@ -48,7 +52,7 @@ class NovaFixedHandler(BaseAddressHandler):
     def process_notification(self, context, event_type, payload):
         LOG.debug('NovaFixedHandler received notification - %s', event_type)
 
-        zone_id = CONF[self.name].zone_id
+        zone_id = self._zone_id
 
         if not zone_id:
             LOG.error('NovaFixedHandler: zone_id is None, ignore the event.')
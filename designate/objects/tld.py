@@ -41,4 +41,4 @@ class TldList(base.ListObjectMixin, base.DesignateObject):
     }
 
     def __contains__(self, key):
-        return bool(list(filter(lambda tld: tld.name == key, self.objects)))
+        return any(tld.name == key for tld in self.objects)
@@ -38,7 +38,7 @@ class Service(service.Service):
         # Initialize extensions
         self._notification_listener = None
         self.handlers = self.init_extensions()
-        self.allowed_event_types = self.get_allowed_event_types(self.handlers)
+        self.event_type_handlers = self.get_event_type_handlers(self.handlers)
 
     @property
     def service_name(self):
@@ -57,17 +57,17 @@ class Service(service.Service):
         return notification_handlers
 
     @staticmethod
-    def get_allowed_event_types(handlers):
-        """Build a list of all allowed event types."""
-        allowed_event_types = []
+    def get_event_type_handlers(handlers):
+        """Build a mapping of event types to their handlers."""
+        event_type_handlers = {}
 
         for handler in handlers:
             for event_type in handler.get_event_types():
-                if event_type in allowed_event_types:
-                    continue
-                allowed_event_types.append(event_type)
+                event_handlers = event_type_handlers.setdefault(event_type, [])
+                if handler not in event_handlers:
+                    event_handlers.append(handler)
 
-        return allowed_event_types
+        return event_type_handlers
 
     def start(self):
         super().start()
@@ -108,10 +108,6 @@ class Service(service.Service):
         Processes an incoming notification, offering each extension the
         opportunity to handle it.
         """
-        if event_type not in self.allowed_event_types:
-            return
-
-        for handler in self.handlers:
-            if event_type in handler.get_event_types():
-                LOG.debug('Found handler for: %s', event_type)
-                handler.process_notification(context, event_type, payload)
+        for handler in self.event_type_handlers.get(event_type, ()):
+            LOG.debug('Found handler for: %s', event_type)
+            handler.process_notification(context, event_type, payload)
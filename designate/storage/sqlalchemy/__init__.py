@@ -2463,7 +2463,10 @@ class SQLAlchemyStorage(base.SQLAlchemy):
     # Reverse Name utils
     def _rname_check(self, criterion):
         # If the criterion has 'name' in it, switch it out for reverse_name
-        if criterion is not None and criterion.get('name', '').startswith('*'):
+        if criterion is None:
+            return criterion
+        name = criterion.get('name')
+        if isinstance(name, str) and name.startswith('*'):
             criterion['reverse_name'] = criterion.pop('name')[::-1]
         return criterion
 
@@ -584,8 +584,6 @@ class CentralZoneTestCase(CentralBasic):
         zone = unit.RoObject(
             name='example.org.', id=CentralZoneTestCase.zone_id
         )
-        self.service._is_valid_recordset_name = mock.Mock(
-            side_effect=Exception)
         self.service.storage.find_zones.return_value = [
             unit.RoObject(name='foo.example.org.')
         ]
@@ -594,21 +592,40 @@ class CentralZoneTestCase(CentralBasic):
             zone,
             'bar.example.org.'
         )
+        # A name merely ending with the child zone's labels is not in it.
+        self.service._is_valid_recordset_placement_subzone(
+            self.context,
+            zone,
+            'barfoo.example.org.'
+        )
 
     def test_is_valid_recordset_placement_subzone_failing(self):
         zone = unit.RoObject(
             name='example.org.', id=CentralZoneTestCase.zone_id
         )
-        self.service._is_valid_recordset_name = mock.Mock()
         self.service.storage.find_zones.return_value = [
-            unit.RoObject(name='foo.example.org.')
+            unit.RoObject(name='foo.example.org.'),
+            unit.RoObject(name='bar.foo.example.org.'),
         ]
 
+        # The closest child zone holding the name is reported.
+        self.assertRaisesRegex(
+            exceptions.InvalidRecordSetLocation,
+            'RecordSet belongs in a child zone: bar.foo.example.org.',
+            self.service._is_valid_recordset_placement_subzone,
+            self.context, zone, 'www.bar.foo.example.org.'
+        )
         self.assertRaisesRegex(
             exceptions.InvalidRecordSetLocation,
             'RecordSet belongs in a child zone: foo.example.org.',
             self.service._is_valid_recordset_placement_subzone,
-            self.context, zone, 'bar.example.org.'
+            self.context, zone, 'www.foo.example.org.'
+        )
+        self.assertRaisesRegex(
+            exceptions.InvalidRecordSetLocation,
+            'RecordSet belongs in a child zone: foo.example.org.',
+            self.service._is_valid_recordset_placement_subzone,
+            self.context, zone, 'foo.example.org.'
         )
 
     def test_is_valid_recordset_records(self):
@@ -1495,6 +1512,7 @@ class CentralZoneTestCase(CentralBasic):
             self.context, fips)
         self.assertEqual({}, data)
         self.assertEqual([], invalid)
+        self.service.find_records.assert_not_called()
 
     def test_determine_floatingips_with_data(self):
         self.context = mock.Mock()
@@ -1513,6 +1531,14 @@ class CentralZoneTestCase(CentralBasic):
         self.assertEqual(1, len(invalid))
         self.assertEqual(1, invalid[0].managed_tenant_id)
         self.assertEqual(data['k'], ({'address': 1}, None))
+        self.service.find_records.assert_called_once_with(
+            mock.ANY,
+            {
+                'managed': True,
+                'managed_resource_type': 'ptr:floatingip',
+                'managed_extra': [1, 2],
+            }
+        )
 
     def test_generate_soa_refresh_interval(self):
         central_service = self.central_service
@@ -1525,16 +1551,14 @@ class IsSubzoneTestCase(CentralBasic):
     def setUp(self):
         super().setUp()
 
-        def find_zone(ctx, criterion):
-            LOG.debug('Calling find_zone on %r' % criterion)
-            if criterion['name'] == 'example.com.':
-                LOG.debug('Returning %r' % criterion['name'])
-                return criterion['name']
-
-            LOG.debug('Not found')
-            raise exceptions.ZoneNotFound
+        def find_zones(ctx, criterion):
+            LOG.debug('Calling find_zones on %r' % criterion)
+            return [
+                unit.RoObject(name=name) for name in criterion['name']
+                if name in ('com.', 'example.com.')
+            ]
 
-        self.service.storage.find_zone = find_zone
+        self.service.storage.find_zones = find_zones
 
     def test_is_subzone_false(self):
         r = self.service._is_subzone(self.context, 'com',
@@ -1555,7 +1579,8 @@ class IsSubzoneTestCase(CentralBasic):
         r = self.service._is_subzone(
             self.context, 'foo.a.b.example.com.',
             CentralZoneTestCase.pool_id)
-        self.assertEqual('example.com.', r)
+        # The closest parent zone wins over 'com.'
+        self.assertEqual('example.com.', r.name)
 
 
 class CentralZoneExportTests(CentralBasic):
@@ -242,6 +242,7 @@ class CentralServiceTest(designate.tests.functional.TestCase):
                 context, zone_, name)
 
         _fail(zone, 'record.sub.example.org.')
+        _fail(zone, 'www.record.sub.example.org.')
         _fail(zone, 'sub.example.org.')
         _ok(zone, 'example.org.')
         _ok(zone, 'record.example.org.')
@@ -4356,6 +4357,60 @@ class CentralServiceTest(designate.tests.functional.TestCase):
         self.assertEqual('test.example.com.', recordsets[0].name)
         self.assertEqual('A', recordsets[0].type)
 
+    def test_create_managed_records_unchanged(self):
+        # Sink writes managed records with a context allowed to edit them.
+        context = self.get_admin_context(
+            all_tenants=True, edit_managed_records=True
+        )
+        zone = self.create_zone(context=context)
+
+        recordset_values = {
+            'zone_id': zone['id'],
+            'name': 'test.example.com.',
+            'type': 'A'
+        }
+        record_values = {
+            'data': '192.0.2.1',
+            'managed': True,
+            'managed_plugin_name': 'plugin',
+            'managed_plugin_type': 'plugin',
+            'managed_resource_type': 'instance',
+            'managed_resource_id': '521935cf-d5be-44a2-9f64-fb5a316a61d3'
+        }
+        self.central_service.create_managed_records(
+            context, zone['id'],
+            records_values=[record_values],
+            recordset_values=recordset_values,
+        )
+
+        with mock.patch.object(self.central_service, 'update_recordset',
+                               wraps=self.central_service.update_recordset
+                               ) as mock_update_recordset:
+            self.central_service.create_managed_records(
+                context, zone['id'],
+                records_values=[record_values],
+                recordset_values=recordset_values,
+            )
+            mock_update_recordset.assert_not_called()
+
+            record_values['data'] = '192.0.2.2'
+            self.central_service.create_managed_records(
+                context, zone['id'],
+                records_values=[record_values],
+                recordset_values=recordset_values,
+            )
+            mock_update_recordset.assert_called_once()
+
+        recordset = self.central_service.find_recordset(
+            context,
+            criterion={'zone_id': zone.id, 'type': 'A'}
+        )
+        records = self.central_service.find_records(
+            context,
+            criterion={'zone_id': zone.id, 'recordset_id': recordset.id}
+        )
+        self.assertEqual(['192.0.2.2'], [record.data for record in records])
+
     def test_create_managed_records_without_managed_data(self):
         zone = self.create_zone()
 
@@ -4488,6 +4543,87 @@ class CentralServiceTest(designate.tests.functional.TestCase):
 
         self.assertEqual(1, len(recordsets))
 
+    def test_delete_managed_records_same_recordset(self):
+        context = self.get_admin_context()
+        zone = self.create_zone(context=context)
+
+        recordset_values = {
+            'zone_id': zone['id'],
+            'name': 'test.example.com.',
+            'type': 'A'
+        }
+        records_values = []
+        for address in ('192.0.2.1', '192.0.2.2'):
+            records_values.append({
+                'data': address,
+                'managed': True,
+                'managed_plugin_name': 'plugin',
+                'managed_plugin_type': 'plugin',
+                'managed_resource_type': 'instance',
+                'managed_resource_id': '7c0b3445-f69d-417b-9938-82a87220332e'
+            })
+        self.central_service.create_managed_records(
+            context, zone['id'],
+            records_values=records_values,
+            recordset_values=recordset_values,
+        )
+
+        criterion = {
+            'managed': True,
+            'managed_plugin_name': 'plugin',
+            'managed_plugin_type': 'plugin',
+            'managed_resource_id': '7c0b3445-f69d-417b-9938-82a87220332e',
+            'managed_resource_type': 'instance'
+        }
+
+        context.edit_managed_records = True
+        with mock.patch.object(self.central_service, 'update_recordset',
+                               wraps=self.central_service.update_recordset
+                               ) as mock_update_recordset:
+            self.central_service.delete_managed_records(
+                context, zone['id'], criterion
+            )
+
+        # Both records are removed with a single delete of the recordset.
+        mock_update_recordset.assert_not_called()
+
+        recordsets = self.central_service.find_recordsets(
+            context,
+            criterion={'zone_id': zone.id, 'type': 'A'}
+        )
+        self.assertEqual(0, len(recordsets))
+
+    def test_invalidate_floatingips_same_recordset(self):
+        context = self.get_admin_context(
+            all_tenants=True, edit_managed_records=True
+        )
+        zone = self.create_zone(context=context)
+
+        recordset = self.create_recordset(zone, context=context, records=[
+            objects.Record(data='192.0.2.1'),
+            objects.Record(data='192.0.2.2'),
+        ])
+        records = self.central_service.find_records(
+            context, {'recordset_id': recordset.id}
+        )
+        self.assertEqual(2, len(records))
+
+        with mock.patch.object(
+                self.central_service, '_delete_or_update_managed_records',
+                wraps=self.central_service._delete_or_update_managed_records
+        ) as mock_delete:
+            self.central_service._invalidate_floatingips(context, records)
+
+        # Both records are removed with a single recordset update.
+        mock_delete.assert_called_once_with(
+            mock.ANY, zone.id, recordset.id, {r.id for r in records}
+        )
+        recordsets = self.central_service.find_recordsets(
+            context,
+            criterion={'zone_id': zone.id, 'type': 'A'}
+        )
+        self.assertEqual(0, len(recordsets))
+
     def test_batch_increment_serial(self):
         zone = self.create_zone()
         zone_serial = zone.serial
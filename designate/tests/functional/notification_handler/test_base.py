@@ -41,6 +41,7 @@ class InheritFormBaseAddressHandler(base.BaseAddressHandler):
 class BaseAddressHandlerTest(designate.tests.functional.TestCase):
     def setUp(self):
         super().setUp()
+        self.addCleanup(base.BaseAddressHandler.clear_zone_cache)
 
         self.zone = self.create_zone()
         self.zone_id = self.zone['id']
@@ -54,6 +55,14 @@ class BaseAddressHandlerTest(designate.tests.functional.TestCase):
                   'ip_address': '1762--B03-1-AF18'}
         self.assertEqual(observe, expect)
 
+    def test_get_ip_data_support_v4(self):
+        addr_dict = {'address': '192.0.2.15', 'version': 4}
+        observe = self.base._get_ip_data(addr_dict)
+        expect = {'octet0': '192', 'octet1': '0', 'octet2': '2',
+                  'octet3': '15', 'ip_version': 4,
+                  'ip_address': '192-0-2-15'}
+        self.assertEqual(observe, expect)
+
     def test_create_record(self):
         self.base._create([
             {'address': '172.16.0.15', 'version': 4}],
@@ -28,6 +28,7 @@ LOG = logging.getLogger(__name__)
 class NeutronFloatingHandlerTest(designate.tests.functional.TestCase):
     def setUp(self):
         super().setUp()
+        self.addCleanup(neutron.NeutronFloatingHandler.clear_zone_cache)
 
         zone = self.create_zone()
         self.zone_id = zone['id']
@@ -32,6 +32,7 @@ LOG = logging.getLogger(__name__)
 class NovaFixedHandlerTest(designate.tests.functional.TestCase):
     def setUp(self):
         super().setUp()
+        self.addCleanup(nova.NovaFixedHandler.clear_zone_cache)
 
         zone = self.create_zone()
         self.zone_id = zone['id']
@@ -76,6 +77,7 @@ class NovaFixedHandlerTest(designate.tests.functional.TestCase):
         self.config(formatv4=['%(display_name)s.%(zone)s'],
                     formatv6=['%(display_name)s.%(zone)s'],
                     group='handler:nova_fixed')
+        self.plugin = nova.NovaFixedHandler()
 
         event_type = 'compute.instance.create.end'
         fixture = base_fixtures.get_notification_fixture('nova', event_type)
@@ -324,6 +326,7 @@ class NovaFixedHandlerTest(designate.tests.functional.TestCase):
         self.config(formatv4=['%(label)s.example.com.'],
                     formatv6=['%(label)s.example.com.'],
                     group='handler:nova_fixed')
+        self.plugin = nova.NovaFixedHandler()
         fixture = base_fixtures.get_notification_fixture('nova', event_type)
         with mock.patch.object(
                 self.central_service.storage, 'find_recordset') as finder:
@@ -344,6 +347,7 @@ class NovaFixedHandlerTest(designate.tests.functional.TestCase):
         event_type = 'compute.instance.create.end'
         self.config(formatv4=['%(label)s-v4.example.com.'],
                     group='handler:nova_fixed')
+        self.plugin = nova.NovaFixedHandler()
         fixture = base_fixtures.get_notification_fixture('nova', event_type)
         with mock.patch.object(
                 self.central_service.storage, 'find_recordset') as finder:
@@ -366,6 +370,7 @@ class NovaFixedHandlerTest(designate.tests.functional.TestCase):
             formatv6=['%(label)s-v6.example.com.'],
             group='handler:nova_fixed'
         )
+        self.plugin = nova.NovaFixedHandler()
         fixture = base_fixtures.get_notification_fixture('nova', event_type)
         with mock.patch.object(
                 self.central_service.storage, 'find_recordset') as finder:
@@ -262,3 +262,36 @@ class NetworkEndpointsFromCatalogTest(oslotest.base.BaseTestCase):
             endpoint_type='publicURL',
             service_catalog=SERVICE_CATALOG,
         )
+
+
+class NetworkAddressTest(oslotest.base.BaseTestCase):
+    def test_address_zone_ipv4(self):
+        self.assertEqual(
+            '2.0.192.in-addr.arpa.',
+            base.NetworkAPI.address_zone('192.0.2.1')
+        )
+
+    def test_address_zone_ipv6(self):
+        self.assertEqual(
+            '0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa.',
+            base.NetworkAPI.address_zone('2001:db8::1')
+        )
+
+    def test_address_name_ipv4(self):
+        self.assertEqual(
+            '1.2.0.192.in-addr.arpa.',
+            base.NetworkAPI.address_name('192.0.2.1')
+        )
+
+    def test_address_name_ipv6(self):
+        self.assertEqual(
+            '1.0.0.0.0.0.0.0.0.0.0.0.0.0.0.0.'
+            '0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa.',
+            base.NetworkAPI.address_name('2001:db8::1')
+        )
+
+    def test_address_name_ipv4_mapped(self):
+        self.assertEqual(
+            '1.2.0.192.in-addr.arpa.',
+            base.NetworkAPI.address_name('::ffff:192.0.2.1')
+        )
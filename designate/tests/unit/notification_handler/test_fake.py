@@ -16,6 +16,7 @@ from unittest import mock
 from oslo_config import fixture as cfg_fixture
 import oslotest.base
 
+from designate.central import rpcapi as central_rpcapi
 import designate.conf
 from designate.notification_handler import fake
 
@@ -27,6 +28,9 @@ class TestFakeHandler(oslotest.base.BaseTestCase):
     @mock.patch('designate.rpc.get_client', mock.Mock())
     def setUp(self):
         super().setUp()
+        central_rpcapi.reset()
+        self.addCleanup(central_rpcapi.reset)
+        self.addCleanup(fake.FakeHandler.clear_zone_cache)
 
         self.useFixture(cfg_fixture.Config(CONF))
 
@@ -16,6 +16,7 @@ from unittest import mock
 from oslo_config import fixture as cfg_fixture
 import oslotest.base
 
+from designate.central import rpcapi as central_rpcapi
 import designate.conf
 from designate.notification_handler import neutron
 from designate.tests import base_fixtures
@@ -28,6 +29,9 @@ class TestNeutronHandler(oslotest.base.BaseTestCase):
     @mock.patch('designate.rpc.get_client', mock.Mock())
     def setUp(self):
         super().setUp()
+        central_rpcapi.reset()
+        self.addCleanup(central_rpcapi.reset)
+        self.addCleanup(neutron.NeutronFloatingHandler.clear_zone_cache)
 
         self.stdlog = base_fixtures.StandardLogging()
         self.useFixture(self.stdlog)
@@ -69,10 +73,10 @@ class TestNeutronHandler(oslotest.base.BaseTestCase):
     def test_get_event_types(self):
         self.assertEqual(
             self.handler.get_event_types(),
-            [
+            (
                 'floatingip.update.end',
                 'floatingip.delete.start'
-            ]
+            )
         )
 
     def test_process_notification_create(self):
@@ -128,6 +132,9 @@ class TestNeutronHandler(oslotest.base.BaseTestCase):
 
     def test_process_notification_no_zone_id_set(self):
         CONF.set_override('zone_id', None, 'handler:neutron_floatingip')
+        self.handler = neutron.NeutronFloatingHandler()
+        self.handler._create = mock.Mock()
+        self.handler._delete = mock.Mock()
 
         self.handler.process_notification(
             mock.Mock(), 'compute.instance.create.end', None
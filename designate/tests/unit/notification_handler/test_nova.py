@@ -11,12 +11,17 @@
 # under the License.mport threading
 
 
+from concurrent import futures
 from unittest import mock
 
 from oslo_config import fixture as cfg_fixture
+import oslo_messaging as messaging
 import oslotest.base
 
+from designate.central import rpcapi as central_rpcapi
 import designate.conf
+from designate import context
+from designate import exceptions
 from designate.notification_handler import nova
 from designate.tests import base_fixtures
 
@@ -28,6 +33,9 @@ class TestNovaHandler(oslotest.base.BaseTestCase):
     @mock.patch('designate.rpc.get_client', mock.Mock())
     def setUp(self):
         super().setUp()
+        central_rpcapi.reset()
+        self.addCleanup(central_rpcapi.reset)
+        self.addCleanup(nova.NovaFixedHandler.clear_zone_cache)
 
         self.stdlog = base_fixtures.StandardLogging()
         self.useFixture(self.stdlog)
@@ -35,6 +43,10 @@ class TestNovaHandler(oslotest.base.BaseTestCase):
 
         self.zone_id = 'b0dc7c26-f605-41c0-b8aa-65d7c086495f'
 
+        mock.patch.object(
+            context.DesignateContext, 'get_admin_context',
+            return_value=mock.Mock()).start()
+
         CONF.set_override(
             'enabled_notification_handlers',
             [nova.NovaFixedHandler.__plugin_name__],
@@ -69,10 +81,10 @@ class TestNovaHandler(oslotest.base.BaseTestCase):
     def test_get_event_types(self):
         self.assertEqual(
             self.handler.get_event_types(),
-            [
+            (
                 'compute.instance.create.end',
                 'compute.instance.delete.start'
-            ]
+            )
         )
 
     def test_process_notification_create(self):
@@ -122,6 +134,9 @@ class TestNovaHandler(oslotest.base.BaseTestCase):
 
     def test_process_notification_no_zone_id_set(self):
         CONF.set_override('zone_id', None, 'handler:nova_fixed')
+        self.handler = nova.NovaFixedHandler()
+        self.handler._create = mock.Mock()
+        self.handler._delete = mock.Mock()
 
         self.handler.process_notification(
             mock.Mock(), 'compute.instance.create.end', None
@@ -134,3 +149,241 @@ class TestNovaHandler(oslotest.base.BaseTestCase):
 
         self.handler._create.assert_not_called()
         self.handler._delete.assert_not_called()
+
+    def test_get_zone_is_cached(self):
+        self.handler.central_api = mock.Mock()
+        self.handler.central_api.get_zone.return_value = {'id': self.zone_id}
+
+        self.handler.get_zone(self.zone_id)
+        zone = self.handler.get_zone(self.zone_id)
+
+        self.assertEqual({'id': self.zone_id}, zone)
+        self.handler.central_api.get_zone.assert_called_once_with(
+            mock.ANY, self.zone_id
+        )
+
+    @mock.patch('time.monotonic')
+    def test_get_zone_cache_expired(self, mock_monotonic):
+        self.handler.central_api = mock.Mock()
+        mock_monotonic.return_value = 100.0
+
+        self.handler.get_zone(self.zone_id)
+
+        mock_monotonic.return_value = 161.0
+        self.handler.get_zone(self.zone_id)
+
+        self.assertEqual(2, self.handler.central_api.get_zone.call_count)
+
+    def test_get_zone_cache_evicts_least_recently_used(self):
+        CONF.set_override('zone_cache_size', 2, 'service:sink')
+        self.handler.central_api = mock.Mock()
+
+        self.handler.get_zone('zone1')
+        self.handler.get_zone('zone2')
+        self.handler.get_zone('zone1')
+        self.handler.get_zone('zone3')
+
+        self.assertEqual(
+            ['zone1', 'zone3'], list(self.handler._zone_cache)
+        )
+        self.assertEqual(3, self.handler.central_api.get_zone.call_count)
+
+    def test_get_zone_lock_released_during_lookup(self):
+        def get_zone(context, zone_id):
+            self.assertFalse(self.handler._zone_cache_lock.locked())
+            self.assertIn(zone_id, self.handler._zone_lookups)
+            return {'id': zone_id}
+
+        self.handler.central_api = mock.Mock()
+        self.handler.central_api.get_zone.side_effect = get_zone
+
+        zone = self.handler.get_zone(self.zone_id)
+
+        self.assertEqual({'id': self.zone_id}, zone)
+        self.assertFalse(self.handler._zone_cache_lock.locked())
+        self.assertEqual({}, self.handler._zone_lookups)
+
+    def test_get_zone_waits_for_pending_lookup(self):
+        self.handler.central_api = mock.Mock()
+        pending = futures.Future()
+        pending.set_result({'id': self.zone_id})
+        self.handler._zone_lookups[self.zone_id] = pending
+
+        zone = self.handler.get_zone(self.zone_id)
+
+        self.assertEqual({'id': self.zone_id}, zone)
+        self.handler.central_api.get_zone.assert_not_called()
+
+    def test_get_zone_lookup_failure_is_not_cached(self):
+        self.handler.central_api = mock.Mock()
+        self.handler.central_api.get_zone.side_effect = (
+            messaging.MessagingTimeout()
+        )
+
+        self.assertRaises(
+            messaging.MessagingTimeout, self.handler.get_zone, self.zone_id
+        )
+        self.assertEqual({}, self.handler._zone_lookups)
+        self.assertNotIn(self.zone_id, self.handler._zone_cache)
+
+    def test_get_zone_lookup_interrupted_finishes_lookup(self):
+        lookups = []
+
+        def get_zone(context, zone_id):
+            lookups.append(self.handler._zone_lookups[zone_id])
+            raise KeyboardInterrupt()
+
+        self.handler.central_api = mock.Mock()
+        self.handler.central_api.get_zone.side_effect = get_zone
+
+        self.assertRaises(
+            KeyboardInterrupt, self.handler.get_zone, self.zone_id
+        )
+        self.assertEqual({}, self.handler._zone_lookups)
+        self.assertIsInstance(lookups[0].exception(), KeyboardInterrupt)
+
+    def test_get_zone_pending_lookup_timeout(self):
+        CONF.set_override('zone_lookup_timeout', 1, 'service:sink')
+        self.handler.central_api = mock.Mock()
+        pending = mock.Mock()
+        pending.result.side_effect = futures.TimeoutError()
+        self.handler._zone_lookups[self.zone_id] = pending
+
+        self.assertRaises(
+            futures.TimeoutError, self.handler.get_zone, self.zone_id
+        )
+        pending.result.assert_called_once_with(timeout=1)
+        self.handler.central_api.get_zone.assert_not_called()
+
+    def test_get_zone_not_found_is_cached(self):
+        self.handler.central_api = mock.Mock()
+        self.handler.central_api.get_zone.side_effect = (
+            exceptions.ZoneNotFound()
+        )
+
+        self.assertRaises(
+            exceptions.ZoneNotFound, self.handler.get_zone, self.zone_id
+        )
+        self.assertRaises(
+            exceptions.ZoneNotFound, self.handler.get_zone, self.zone_id
+        )
+        self.assertEqual({}, self.handler._zone_lookups)
+        self.handler.central_api.get_zone.assert_called_once_with(
+            mock.ANY, self.zone_id
+        )
+
+    def test_get_zone_not_found_cache_disabled(self):
+        CONF.set_override('zone_negative_cache_ttl', 0, 'service:sink')
+        self.handler.central_api = mock.Mock()
+        self.handler.central_api.get_zone.side_effect = (
+            exceptions.ZoneNotFound()
+        )
+
+        self.assertRaises(
+            exceptions.ZoneNotFound, self.handler.get_zone, self.zone_id
+        )
+        self.assertNotIn(self.zone_id, self.handler._zone_cache)
+
+    def test_get_zone_cache_is_shared(self):
+        self.handler.central_api = mock.Mock()
+        self.handler.central_api.get_zone.return_value = {'id': self.zone_id}
+        handler = nova.NovaFixedHandler()
+        handler.central_api = mock.Mock()
+
+        self.handler.get_zone(self.zone_id)
+        zone = handler.get_zone(self.zone_id)
+
+        self.assertEqual({'id': self.zone_id}, zone)
+        handler.central_api.get_zone.assert_not_called()
+
+    def test_get_zone_cache_disabled(self):
+        CONF.set_override('zone_cache_ttl', 0, 'service:sink')
+        self.handler.central_api = mock.Mock()
+
+        self.handler.get_zone(self.zone_id)
+        self.handler.get_zone(self.zone_id)
+
+        self.assertEqual(2, self.handler.central_api.get_zone.call_count)
+
+    @mock.patch('designate.notification_handler.base.DesignateContext')
+    def test_create_zone_not_found_invalidates_zone(self, mock_context):
+        with mock.patch('designate.rpc.get_client', mock.Mock()):
+            handler = nova.NovaFixedHandler()
+        handler.central_api = mock.Mock()
+        handler.central_api.get_zone.return_value = {
+            'id': self.zone_id, 'name': 'example.org.'
+        }
+        handler.central_api.create_managed_records.side_effect = (
+            exceptions.ZoneNotFound()
+        )
+
+        self.assertRaises(
+            exceptions.ZoneNotFound,
+            handler._create,
+            [{'address': '192.0.2.1', 'version': 4, 'label': 'private'}],
+            {'hostname': 'test01'},
+            self.zone_id,
+        )
+        self.assertNotIn(self.zone_id, handler._zone_cache)
+
+    def test_central_api_is_shared(self):
+        handler = nova.NovaFixedHandler()
+
+        self.assertIs(self.handler.central_api, handler.central_api)
+
+    @mock.patch('designate.notification_handler.base.DesignateContext')
+    def test_create_groups_records_by_recordset(self, mock_context):
+        CONF.set_override(
+            'formatv4', ['%(hostname)s.%(zone)s'], 'handler:nova_fixed'
+        )
+        handler = nova.NovaFixedHandler()
+        handler.central_api = mock.Mock()
+        handler.central_api.get_zone.return_value = {
+            'id': self.zone_id, 'name': 'example.org.'
+        }
+
+        handler._create(
+            [
+                {'address': '192.0.2.1', 'version': 4, 'label': 'private'},
+                {'address': '192.0.2.2', 'version': 4, 'label': 'private'},
+                {'address': '192.0.2.2', 'version': 4, 'label': 'public'},
+            ],
+            {'hostname': 'test01'},
+            self.zone_id,
+        )
+
+        handler.central_api.create_managed_records.assert_called_once_with(
+            mock.ANY, self.zone_id,
+            records_values=[
+                {
+                    'data': '192.0.2.1',
+                    'managed': True,
+                    'managed_plugin_name': 'nova_fixed',
+                    'managed_plugin_type': 'handler',
+                    'managed_resource_type': None,
+                    'managed_resource_id': None,
+                },
+                {
+                    'data': '192.0.2.2',
+                    'managed': True,
+                    'managed_plugin_name': 'nova_fixed',
+                    'managed_plugin_type': 'handler',
+                    'managed_resource_type': None,
+                    'managed_resource_id': None,
+                },
+            ],
+            recordset_values={
+                'zone_id': self.zone_id,
+                'name': 'test01.example.org.',
+                'type': 'A',
+            },
+        )
+
+    def test_create_without_addresses(self):
+        handler = nova.NovaFixedHandler()
+        handler.central_api = mock.Mock()
+
+        handler._create([], {'hostname': 'test01'}, self.zone_id)
+
+        handler.central_api.get_zone.assert_not_called()
+        handler.central_api.create_managed_records.assert_not_called()
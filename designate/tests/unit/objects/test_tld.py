@@ -0,0 +1,30 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+import oslotest.base
+
+from designate import objects
+
+
+class TldTest(oslotest.base.BaseTestCase):
+    def test_tld_list_contains(self):
+        tlds = objects.TldList(objects=[
+            objects.Tld(name='com'),
+            objects.Tld(name='co.uk'),
+        ])
+
+        self.assertIn('com', tlds)
+        self.assertIn('co.uk', tlds)
+        self.assertNotIn('uk', tlds)
+        self.assertNotIn('example.com', tlds)
+
+    def test_tld_list_contains_empty(self):
+        self.assertNotIn('com', objects.TldList())
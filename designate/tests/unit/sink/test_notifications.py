@@ -16,6 +16,7 @@ from unittest import mock
 from oslo_config import fixture as cfg_fixture
 import oslotest.base
 
+from designate.central import rpcapi as central_rpcapi
 import designate.conf
 from designate.notification_handler import fake
 from designate import policy
@@ -36,6 +37,8 @@ class TestSinkNotification(oslotest.base.BaseTestCase):
     def setUp(self, mock_rpc_initialized, mock_rpc_init, mock_rpc_get_client,
               mock_policy_init):
         super().setUp()
+        central_rpcapi.reset()
+        self.addCleanup(central_rpcapi.reset)
 
         mock_rpc_initialized.return_value = False
 
@@ -16,6 +16,7 @@ from unittest import mock
 from oslo_config import fixture as cfg_fixture
 import oslotest.base
 
+from designate.central import rpcapi as central_rpcapi
 from designate.common import profiler
 import designate.conf
 from designate import policy
@@ -33,6 +34,8 @@ class TestSinkService(oslotest.base.BaseTestCase):
     @mock.patch.object(profiler, 'setup_profiler')
     def setUp(self, mock_setup_profiler, mock_get_client, mock_policy_init):
         super().setUp()
+        central_rpcapi.reset()
+        self.addCleanup(central_rpcapi.reset)
         self.stdlog = base_fixtures.StandardLogging()
         self.useFixture(self.stdlog)
         self.useFixture(cfg_fixture.Config(CONF))
@@ -93,13 +96,13 @@ class TestSinkService(oslotest.base.BaseTestCase):
     def test_service_name(self):
         self.assertEqual('sink', self.service.service_name)
 
-    def test_get_allowed_event_types(self):
+    def test_event_type_handlers(self):
         self.assertEqual(
-            ['compute.instance.create.end'],
-            self.service.get_allowed_event_types(self.service.handlers)
+            {'compute.instance.create.end': self.service.handlers},
+            self.service.event_type_handlers
         )
 
-    def test_get_allowed_event_types_with_duplicates(self):
+    def test_get_event_type_handlers(self):
         mock_handler1 = mock.Mock()
         mock_handler2 = mock.Mock()
 
@@ -108,14 +111,20 @@ class TestSinkService(oslotest.base.BaseTestCase):
         ]
         mock_handler2.get_event_types.return_value = [
             'compute.instance.create.end',
-            'compute.instance.create.start'
+            'compute.instance.create.start',
+            'compute.instance.create.end'
         ]
 
-        handlers = [mock_handler1, mock_handler2]
-
         self.assertEqual(
-            ['compute.instance.create.start', 'compute.instance.create.end'],
-            self.service.get_allowed_event_types(handlers)
+            {
+                'compute.instance.create.start': [
+                    mock_handler1, mock_handler2
+                ],
+                'compute.instance.create.end': [mock_handler2],
+            },
+            self.service.get_event_type_handlers(
+                [mock_handler1, mock_handler2]
+            )
         )
 
     def test_service_info(self):
@@ -123,7 +132,9 @@ class TestSinkService(oslotest.base.BaseTestCase):
             'compute.instance.create.end',
             'compute.instance.create.start'
         ]
-        self.service.allowed_event_types = events
+        self.service.event_type_handlers = {
+            'compute.instance.create.end': self.service.handlers
+        }
 
         for event in events:
             self.service.info(
@@ -21,7 +21,9 @@ import dns.exception
 import dns.message
 import dns.name
 import dns.rcode
+import dns.rdataclass
 import dns.rdatatype
+import dns.rrset
 import dns.zone
 import eventlet
 from oslo_config import fixture as cfg_fixture
@@ -257,12 +259,10 @@ class TestDNSMessages(oslotest.base.BaseTestCase):
 
     @mock.patch.object(dnsutils, 'send_dns_message')
     def test_get_serial(self, mock_send_dns_message):
-        mock_rdataset = mock.Mock(serial=5)
-        mock_answer = mock.Mock()
-        mock_answer.to_rdataset.return_value = [mock_rdataset]
+        mock_rdata = mock.Mock(serial=5)
 
         mock_result = mock.Mock()
-        mock_result.answer = [mock_answer]
+        mock_result.answer = [[mock_rdata]]
         mock_send_dns_message.return_value = mock_result
 
         self.assertEqual(
@@ -294,11 +294,13 @@ class TestDNSMessages(oslotest.base.BaseTestCase):
 
     @mock.patch.object(dnsutils, 'send_dns_message')
     def test_get_serial_no_rdataset(self, mock_send_dns_message):
-        mock_answer = mock.Mock()
-        mock_answer.to_rdataset.return_value = []
+        empty_rrset = dns.rrset.RRset(
+            dns.name.from_text('serial.test.'),
+            dns.rdataclass.IN, dns.rdatatype.SOA
+        )
 
         mock_result = mock.Mock()
-        mock_result.answer = [mock_answer]
+        mock_result.answer = [empty_rrset]
         mock_send_dns_message.return_value = mock_result
 
         self.assertFalse(
@@ -19,6 +19,7 @@ from unittest import mock
 import dns
 import dns.rdataclass
 import dns.rdatatype
+import dns.rrset
 from oslo_config import fixture as cfg_fixture
 import oslotest.base
 
@@ -83,15 +84,13 @@ class WorkerNotifyTest(oslotest.base.BaseTestCase):
 
     @mock.patch('time.sleep', mock.Mock())
     def test_get_serial_number_ok(self):
-        zone = RoObject(name='zn', serial=314)
-        ds = RoObject(items=[zone])
+        zone = RoObject(name='zn.', serial=314)
+        rrset = dns.rrset.from_text(
+            'zn.', 3600, 'IN', 'SOA',
+            'ns.zn. admin.zn. 314 3600 600 86400 3600'
+        )
         response = RoObject(
-            answer=[RoObject(
-                name='zn',
-                rdclass=dns.rdataclass.IN,
-                rdtype=dns.rdatatype.SOA,
-                to_rdataset=mock.Mock(return_value=ds)
-            )],
+            answer=[rrset],
             rcode=mock.Mock(return_value=dns.rcode.NOERROR),
             flags=dns.flags.AA,
             ednsflags=dns.rcode.NOERROR,
@@ -104,6 +103,26 @@ class WorkerNotifyTest(oslotest.base.BaseTestCase):
         )
         self.assertEqual(('SUCCESS', 314), notify())
 
+    @mock.patch('random.uniform', mock.Mock(return_value=0))
+    @mock.patch('time.sleep')
+    def test_get_serial_number_retry_backoff(self, mock_sleep):
+        CONF.set_override('serial_max_retries', 5, 'service:worker')
+        CONF.set_override('serial_retry_delay', 2, 'service:worker')
+
+        notify = worker_zone.GetZoneSerial(mock.Mock(), mock.Mock(),
+                                           self.zone, '203.0.113.1',
+                                           1234)
+        notify._make_and_send_soa_message = mock.Mock(return_value=None)
+
+        self.assertEqual(('ERROR', None), notify())
+
+        # The delay is capped at twice the retry delay and there is no
+        # sleep after the last attempt.
+        mock_sleep.assert_has_calls(
+            [mock.call(1.0), mock.call(2.0), mock.call(4), mock.call(4)]
+        )
+        self.assertEqual(4, mock_sleep.call_count)
+
     @mock.patch('time.sleep', mock.Mock())
     @mock.patch.object(dnsutils, 'send_dns_message')
     def test_make_and_send_dns_message_error_flags(self,
@@ -151,9 +170,11 @@ class WorkerNotifyTest(oslotest.base.BaseTestCase):
 
         self.assertIsNone(out)
 
+    @mock.patch.object(worker_zone, 'LOG')
     @mock.patch.object(dnsutils, 'send_dns_message')
     def test_make_and_send_dns_message_bad_response(self,
-                                                    mock_send_dns_message):
+                                                    mock_send_dns_message,
+                                                    mock_log):
         self.notify._make_dns_message = mock.Mock(return_value='')
         mock_send_dns_message.side_effect = dns.query.BadResponse
 
@@ -162,9 +183,13 @@ class WorkerNotifyTest(oslotest.base.BaseTestCase):
         )
 
         self.assertIsNone(out)
+        mock_log.warning.assert_called_once()
+        self.assertNotIn('timeout', mock_log.warning.call_args[0][0])
 
+    @mock.patch.object(worker_zone, 'LOG')
     @mock.patch.object(dnsutils, 'send_dns_message')
-    def test_make_and_send_dns_message_eagain(self, mock_send_dns_message):
+    def test_make_and_send_dns_message_eagain(self, mock_send_dns_message,
+                                              mock_log):
         # bug #1558096
         socket_error = socket.error()
         socket_error.errno = socket.errno.EAGAIN
@@ -175,6 +200,8 @@ class WorkerNotifyTest(oslotest.base.BaseTestCase):
         )
 
         self.assertIsNone(out)
+        mock_log.info.assert_called_once()
+        mock_log.warning.assert_not_called()
 
     @mock.patch.object(dnsutils, 'send_dns_message')
     def test_make_and_send_dns_message_econnrefused(self,
@@ -15,9 +15,11 @@
 # under the License.
 from collections import namedtuple
 import errno
+import random
 import time
 
 import dns
+import dns.rcode
 from oslo_log import log as logging
 from oslo_utils import timeutils
 
@@ -32,6 +34,11 @@ from designate.worker.tasks import base
 LOG = logging.getLogger(__name__)
 CONF = designate.conf.CONF
 
+# Response codes to a SOA query that mean the server does not have the zone.
+NO_ZONE_RCODES = frozenset(
+    (dns.rcode.NXDOMAIN, dns.rcode.REFUSED, dns.rcode.SERVFAIL)
+)
+
 ######################
 # CRUD Zone Operations
 ######################
@@ -640,13 +647,14 @@ class GetZoneSerial(base.Task):
         self.serial_timeout = CONF['service:worker'].serial_timeout
 
     def __call__(self):
+        log_info = {
+            'zone': self.zone.name,
+            'server': self.host,
+            'port': self.port,
+        }
         LOG.debug(
             'Sending SOA for zone_name=%(zone)s to %(server)s:%(port)d.',
-            {
-                'zone': self.zone.name,
-                'server': self.host,
-                'port': self.port,
-            }
+            log_info
         )
         actual_serial = None
         status = 'ERROR'
@@ -656,10 +664,8 @@ class GetZoneSerial(base.Task):
             )
             if not response:
                 pass
-            elif (response.rcode() in (
-                    dns.rcode.NXDOMAIN,
-                    dns.rcode.REFUSED,
-                    dns.rcode.SERVFAIL) or not bool(response.answer)):
+            elif (response.rcode() in NO_ZONE_RCODES or
+                    not bool(response.answer)):
                 status = 'NO_ZONE'
                 if (self.zone.serial == 0 and
                         self.zone.action in ('DELETE', 'NONE')):
@@ -670,11 +676,7 @@ class GetZoneSerial(base.Task):
                     'Unable to get serial for zone_name=%(zone)s '
                     'to %(server)s:%(port)d. '
                     'Unable to get an Authoritative Answer from server.',
-                    {
-                        'zone': self.zone.name,
-                        'server': self.host,
-                        'port': self.port,
-                    }
+                    log_info
                 )
                 break
             elif dns.rcode.from_flags(
@@ -684,27 +686,37 @@ class GetZoneSerial(base.Task):
                   str(response.answer[0].name) == self.zone.name and
                   response.answer[0].rdclass == dns.rdataclass.IN and
                   response.answer[0].rdtype == dns.rdatatype.SOA):
-                rrset = response.answer[0]
-                actual_serial = list(rrset.to_rdataset().items)[0].serial
+                actual_serial = response.answer[0][0].serial
 
             if actual_serial is not None:
                 status = 'SUCCESS'
                 break
-            time.sleep(self.serial_retry_delay)
+            if retry + 1 < self.serial_max_retries:
+                time.sleep(self._get_retry_delay(retry))
 
         if actual_serial is None:
             LOG.warning(
-                'Unable to get serial for zone_name=%(zone)s'
+                'Unable to get serial for zone_name=%(zone)s '
                 'to %(server)s:%(port)d.',
-                {
-                    'zone': self.zone.name,
-                    'server': self.host,
-                    'port': self.port,
-                }
+                log_info
             )
 
         return status, actual_serial
 
+    def _get_retry_delay(self, retry):
+        """
+        Exponential back-off with jitter, starting at half of the configured
+        retry delay so that zones which converge quickly are detected sooner.
+        Each delay is capped at twice the configured retry delay, so the
+        total time spent retrying stays close to what it was without
+        back-off.
+
+        :param retry: The number of the attempt that just failed.
+        """
+        base = self.serial_retry_delay / 2.0
+        delay = base * 2 ** retry + random.uniform(0, base / 2)
+        return min(delay, self.serial_retry_delay * 2)
+
     def _make_and_send_soa_message(self, zone_name, host, port):
         """
         Generate and send a SOA message.
@@ -720,39 +732,35 @@ class GetZoneSerial(base.Task):
         except OSError as e:
             if e.errno != errno.EAGAIN:
                 raise
-            LOG.info(
-                'Got EAGAIN while trying to send SOA for '
-                'zone_name=%(zone_name)s to %(server)s:%(port)d. '
-                'timeout=%(timeout)d seconds.',
-                {
-                    'zone_name': zone_name,
-                    'server': host,
-                    'port': port,
-                    'timeout': self.serial_timeout
-                }
-            )
+            # EAGAIN is transient and expected under load.
+            log = LOG.info
+            reason = 'EAGAIN'
+            with_timeout = True
         except dns.exception.Timeout:
-            LOG.warning(
-                'Got Timeout while trying to send SOA for '
-                'zone_name=%(zone_name)s to %(server)s:%(port)d. '
-                'timeout=%(timeout)d seconds.',
-                {
-                    'zone_name': zone_name,
-                    'server': host,
-                    'port': port,
-                    'timeout': self.serial_timeout
-                }
-            )
+            log = LOG.warning
+            reason = 'Timeout'
+            with_timeout = True
         except dns.query.BadResponse:
-            LOG.warning(
-                'Got BadResponse while trying to send SOA '
-                'for zone_name=%(zone_name)s to %(server)s:%(port)d.',
-                {
-                    'zone_name': zone_name,
-                    'server': host,
-                    'port': port,
-                }
-            )
+            log = LOG.warning
+            reason = 'BadResponse'
+            with_timeout = False
+
+        message = (
+            'Got %(reason)s while trying to send SOA for '
+            'zone_name=%(zone_name)s to %(server)s:%(port)d.'
+        )
+        if with_timeout:
+            message += ' timeout=%(timeout)d seconds.'
+        log(
+            message,
+            {
+                'reason': reason,
+                'zone_name': zone_name,
+                'server': host,
+                'port': port,
+                'timeout': self.serial_timeout
+            }
+        )
 
 
 ###################